@@ -1,17 +1,31 @@
 """Aura MCP tools."""
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastmcp import FastMCP
 from server import AuraMCPServer
 
+server = AuraMCPServer()
+
+# The session wallet never changes, so the tool's answer is a constant
+_DID_STRING = f"🔑 Agent Wallet DID: {server.wallet.did}"
+
+
+@asynccontextmanager
+async def lifespan(_: FastMCP) -> AsyncIterator[None]:
+    """Warm the Gateway connection pool once the event loop is running."""
+    await server.warmup()
+    yield
+
+
 mcp = FastMCP(
     name="Aura",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 
-server = AuraMCPServer()
-
-
 @mcp.tool
 async def search_hotels(query: str, limit: int = 3) -> str:
     """
@@ -45,7 +59,7 @@ async def negotiate_price(item_id: str, bid: float) -> str:
 @mcp.tool
 def demonstrate_wallet() -> str:
     """Demonstrate the generated wallet's DID."""
-    return f"🔑 Agent Wallet DID: {server.wallet.did}"
+    return _DID_STRING
 
 
 if __name__ == "__main__":
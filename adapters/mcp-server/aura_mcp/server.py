@@ -5,14 +5,18 @@ This server acts as a proxy between AI models (via MCP) and the Aura Gateway,
 providing search and negotiation capabilities to LLMs like Claude 3.5 Sonnet.
 """
 
+import asyncio
 import logging
 import os
+from collections.abc import Callable
+from typing import Any
 
 import httpx
+import orjson
 from dotenv import load_dotenv
 
 # Import AgentWallet from parent directory
-from aura_mcp.wallet import AgentWallet
+from aura_mcp.wallet import AgentWallet, canonical_json
 
 # Configure logging
 logging.basicConfig(
@@ -25,6 +29,60 @@ logger = logging.getLogger("aura-mcp-server")
 load_dotenv()
 
 GATEWAY_URL = os.getenv("AURA_GATEWAY_URL", "http://localhost:8000")
+HTTP_TIMEOUT = float(os.getenv("AURA_HTTP_TIMEOUT", "30.0"))
+HTTP_CONNECT_TIMEOUT = float(os.getenv("AURA_HTTP_CONNECT_TIMEOUT", "5.0"))
+# Per-server cap on concurrent Gateway calls; kept below the pool's
+# max_connections (100) so requests queue here instead of in httpx.
+MAX_IN_FLIGHT = int(os.getenv("AURA_MAX_INFLIGHT", "32"))
+
+# Signed request headers
+_AGENT_HDR, _TS_HDR, _SIG_HDR = "X-Agent-ID", "X-Timestamp", "X-Signature"
+_CONTENT_TYPE_HDR, _JSON = "Content-Type", "application/json"
+
+# Shared HTTP client: one connection pool (and TLS context) per process
+_shared_client: httpx.AsyncClient | None = None
+_client_refs = 0
+
+
+def _fmt_accepted(data: dict[str, Any], bid: float) -> str:
+    reservation_code = data.get("data", {}).get("reservation_code", "unknown")
+    return f"🎉 SUCCESS! Reservation: {reservation_code}"
+
+
+def _fmt_countered(data: dict[str, Any], bid: float) -> str:
+    proposed_price = data.get("data", {}).get("proposed_price", bid)
+    message = data.get("data", {}).get("message", "No reason provided")
+    return f"🔄 COUNTER-OFFER: ${proposed_price:.2f}. Message: {message}"
+
+
+def _fmt_ui_required(data: dict[str, Any], bid: float) -> str:
+    template = data.get("action_required", {}).get("template", "unknown")
+    return f"🚨 HUMAN INTERVENTION REQUIRED. Template: {template}"
+
+
+def _fmt_rejected(data: dict[str, Any], bid: float) -> str:
+    return "🚫 REJECTED"
+
+
+# Negotiation status -> LLM-facing message formatter
+_STATUS_FORMATTERS: dict[str, Callable[[dict[str, Any], float], str]] = {
+    "accepted": _fmt_accepted,
+    "countered": _fmt_countered,
+    "ui_required": _fmt_ui_required,
+    "rejected": _fmt_rejected,
+}
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the process-wide HTTP client, creating it on first use."""
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(HTTP_TIMEOUT, connect=HTTP_CONNECT_TIMEOUT),
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            http2=True,
+        )
+    return _shared_client
 
 
 class AuraMCPServer:
@@ -39,12 +97,31 @@ class AuraMCPServer:
     """
 
     def __init__(self):
-        """Initialize the MCP server and HTTP client."""
+        """Initialize the MCP server and attach to the shared HTTP client."""
+        global _client_refs
         self.wallet = AgentWallet()  # Generate temporary wallet
-        self.client = httpx.AsyncClient(timeout=30.0)
+        self.client = get_client()
+        self._sem = asyncio.Semaphore(MAX_IN_FLIGHT)
+        _client_refs += 1
 
         logger.info("🔑 Generated temporary agent wallet")
-        logger.info(f"DID: {self.wallet.did}")
+        logger.info("DID: %s", self.wallet.did)
+
+        # Open a keepalive connection before the first tool call, if we can
+        self._warmup_task: asyncio.Task | None = None
+        try:
+            self._warmup_task = asyncio.get_running_loop().create_task(self.warmup())
+        except RuntimeError:
+            # No running loop (e.g. created at import time); see main.lifespan
+            pass
+
+    async def warmup(self) -> None:
+        """Pre-open a pooled connection to the Gateway; failures are ignored."""
+        try:
+            await self.client.get(f"{GATEWAY_URL}/healthz", timeout=2.0)
+            logger.debug("🔥 Gateway connection warmed up")
+        except httpx.HTTPError as e:
+            logger.debug("Gateway warm-up skipped: %s", e)
 
     async def search_hotels(self, query: str, limit: int = 3) -> str:
         """
@@ -57,51 +134,52 @@ class AuraMCPServer:
         Returns:
             Formatted string with search results for LLM consumption
         """
-        logger.info(f"🔍 Searching hotels: '{query}' (limit: {limit})")
+        logger.info("🔍 Searching hotels: %r (limit: %d)", query, limit)
         body = {"query": query, "limit": limit}
 
         try:
-            # Sign the request
-            agent_id, timestamp, signature = self.wallet.sign_request(
-                "POST", "/v1/search", body
+            # Serialize once and sign the exact bytes sent on the wire
+            payload = canonical_json(body)
+            agent_id, timestamp, signature = self.wallet.sign_request_bytes(
+                "POST", "/v1/search", payload
             )
 
             # Make request to Aura Gateway
-            response = await self.client.post(
-                f"{GATEWAY_URL}/v1/search",
-                json=body,
-                headers={
-                    "X-Agent-ID": agent_id,
-                    "X-Timestamp": timestamp,
-                    "X-Signature": signature,
-                    "Content-Type": "application/json",
-                },
-            )
+            async with self._sem:
+                response = await self.client.post(
+                    f"{GATEWAY_URL}/v1/search",
+                    content=payload,
+                    headers={
+                        _AGENT_HDR: agent_id,
+                        _TS_HDR: timestamp,
+                        _SIG_HDR: signature,
+                        _CONTENT_TYPE_HDR: _JSON,
+                    },
+                )
 
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
             # Format results for LLM
-            results = []
-            for item in data.get("results", []):
-                results.append(
+            if not (
+                lines := "\n".join(
                     f"{item['name']} - ${item['price']:.2f} "
                     f"(Relevance: {item['score']:.2f}) - {item.get('details', 'No details')}"
+                    for item in data.get("results", ())
                 )
-
-            if results:
-                return "🏨 Search Results:\n" + "\n".join(results)
-            else:
+            ):
                 return "No hotels found matching your criteria."
 
+            return "🏨 Search Results:\n" + lines
+
         except httpx.HTTPStatusError as e:
-            logger.error(f"🔴 Gateway error: {e}")
+            logger.error("🔴 Gateway error: %s", e)
             return f"❌ Search failed: Gateway returned error {e.response.status_code}"
         except httpx.RequestError as e:
-            logger.error(f"🔴 Network error: {e}")
+            logger.error("🔴 Network error: %s", e)
             return "❌ Search failed: Could not connect to Aura Gateway"
         except Exception as e:
-            logger.error(f"🔴 Unexpected error in search_hotels: {e}", exc_info=True)
+            logger.error("🔴 Unexpected error in search_hotels: %s", e, exc_info=True)
             return "❌ Search failed due to an unexpected internal error."
 
     async def negotiate_price(self, item_id: str, bid: float) -> str:
@@ -115,7 +193,7 @@ class AuraMCPServer:
         Returns:
             Formatted string with negotiation result for LLM consumption
         """
-        logger.info(f"💰 Negotiating {item_id}: ${bid:.2f}")
+        logger.info("💰 Negotiating %s: $%.2f", item_id, bid)
 
         body = {
             "item_id": item_id,
@@ -125,61 +203,49 @@ class AuraMCPServer:
         }
 
         try:
-            # Sign the request
-            agent_id, timestamp, signature = self.wallet.sign_request(
-                "POST", "/v1/negotiate", body
+            # Serialize once and sign the exact bytes sent on the wire
+            payload = canonical_json(body)
+            agent_id, timestamp, signature = self.wallet.sign_request_bytes(
+                "POST", "/v1/negotiate", payload
             )
 
             # Make request to Aura Gateway
-            response = await self.client.post(
-                f"{GATEWAY_URL}/v1/negotiate",
-                json=body,
-                headers={
-                    "X-Agent-ID": agent_id,
-                    "X-Timestamp": timestamp,
-                    "X-Signature": signature,
-                    "Content-Type": "application/json",
-                },
-            )
+            async with self._sem:
+                response = await self.client.post(
+                    f"{GATEWAY_URL}/v1/negotiate",
+                    content=payload,
+                    headers={
+                        _AGENT_HDR: agent_id,
+                        _TS_HDR: timestamp,
+                        _SIG_HDR: signature,
+                        _CONTENT_TYPE_HDR: _JSON,
+                    },
+                )
 
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
             # Handle polymorphic responses
             status = data.get("status")
-
-            if status == "accepted":
-                reservation_code = data.get("data", {}).get(
-                    "reservation_code", "unknown"
-                )
-                return f"🎉 SUCCESS! Reservation: {reservation_code}"
-
-            elif status == "countered":
-                proposed_price = data.get("data", {}).get("proposed_price", bid)
-                message = data.get("data", {}).get("message", "No reason provided")
-                return f"🔄 COUNTER-OFFER: ${proposed_price:.2f}. Message: {message}"
-
-            elif status == "ui_required":
-                template = data.get("action_required", {}).get("template", "unknown")
-                return f"🚨 HUMAN INTERVENTION REQUIRED. Template: {template}"
-
-            elif status == "rejected":
-                return "🚫 REJECTED"
-
-            else:
+            formatter = _STATUS_FORMATTERS.get(status)
+            if formatter is None:
                 return f"❓ Unknown negotiation status: {status}"
+            return formatter(data, bid)
 
         except httpx.HTTPStatusError as e:
-            logger.error(f"🔴 Gateway error: {e}")
+            logger.error("🔴 Gateway error: %s", e)
             return f"❌ Negotiation failed: Gateway returned error {e.response.status_code}"
         except httpx.RequestError as e:
-            logger.error(f"🔴 Network error: {e}")
+            logger.error("🔴 Network error: %s", e)
             return "❌ Negotiation failed: Could not connect to Aura Gateway"
         except Exception as e:
-            logger.error(f"🔴 Unexpected error in negotiate_price: {e}", exc_info=True)
+            logger.error("🔴 Unexpected error in negotiate_price: %s", e, exc_info=True)
             return "❌ Negotiation failed due to an unexpected internal error."
 
     async def shutdown(self):
-        """Close the underlying HTTP client."""
-        await self.client.aclose()
-        logger.info("🔌 Closed HTTP client.")
+        """Release the shared HTTP client, closing it once no server uses it."""
+        global _client_refs
+        _client_refs = max(_client_refs - 1, 0)
+        if _client_refs == 0 and not self.client.is_closed:
+            await self.client.aclose()
+            logger.info("🔌 Closed HTTP client.")
@@ -4,14 +4,34 @@ Agent Identity Module for Aura Platform
 Provides cryptographic key management and message signing using Ed25519.
 """
 
+import base64
 import hashlib
 import json
+import logging
+import os
 import time
+from collections.abc import Callable
 from typing import Any
 
 import nacl.encoding
 import nacl.signing
 
+try:
+    from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+except ImportError:  # pragma: no cover - optional backend
+    Ed25519PrivateKey = None
+
+# Signing backend: "nacl" (libsodium, default) or "cryptography" (OpenSSL).
+# Ed25519 is deterministic, so both produce identical signatures.
+ED25519_BACKEND = os.getenv("AURA_ED25519_BACKEND", "nacl")
+
+logger = logging.getLogger(__name__)
+
+
+# X-Signature lengths: unpadded base64url, or legacy hex (64 bytes either way)
+_BASE64URL_SIGNATURE_LENGTH = 86
+_HEX_SIGNATURE_LENGTH = 128
+
 
 class AgentWallet:
     """
@@ -49,10 +69,26 @@ class AgentWallet:
             self.signing_key = nacl.signing.SigningKey.generate()
             self.verify_key = self.signing_key.verify_key
 
+        # Key material never changes, so encode the identity once
+        self._public_key_hex = self.verify_key.encode(
+            encoder=nacl.encoding.HexEncoder
+        ).decode()
+        self._did = f"did:key:{self._public_key_hex}"
+        self._sign = self._build_signer()
+
+    def _build_signer(self) -> Callable[[bytes], bytes] | None:
+        """Return a function producing raw 64-byte signatures, if we can sign."""
+        if not self.signing_key:
+            return None
+        if ED25519_BACKEND == "cryptography" and Ed25519PrivateKey is not None:
+            return Ed25519PrivateKey.from_private_bytes(bytes(self.signing_key)).sign
+        signing_key = self.signing_key
+        return lambda message: signing_key.sign(message).signature
+
     @property
     def did(self) -> str:
         """Return Decentralized Identifier (DID) for this agent."""
-        return f"did:key:{self.verify_key.encode(encoder=nacl.encoding.HexEncoder).decode()}"
+        return self._did
 
     @property
     def private_key_hex(self) -> str:
@@ -64,7 +100,7 @@ class AgentWallet:
     @property
     def public_key_hex(self) -> str:
         """Return public key as hex string."""
-        return self.verify_key.encode(encoder=nacl.encoding.HexEncoder).decode()
+        return self._public_key_hex
 
     def sign_request(
         self, method: str, path: str, body: dict[str, Any]
@@ -83,31 +119,50 @@ class AgentWallet:
         Raises:
             ValueError: If wallet is in view-only mode
         """
-        if not self.signing_key:
+        return self.sign_request_bytes(method, path, canonical_json(body))
+
+    def sign_request_bytes(
+        self, method: str, path: str, payload: bytes
+    ) -> tuple[str, str, str]:
+        """
+        Sign a request whose body is already serialized as canonical JSON.
+
+        Sending the same ``payload`` bytes on the wire avoids serializing
+        the body twice.
+
+        Args:
+            method: HTTP method (e.g., "POST")
+            path: Request path (e.g., "/v1/negotiate")
+            payload: Body bytes as produced by ``canonical_json``
+
+        Returns:
+            Tuple of (X-Agent-ID, X-Timestamp, X-Signature)
+
+        Raises:
+            ValueError: If wallet is in view-only mode
+        """
+        if not self._sign:
             raise ValueError("Cannot sign without private key")
 
         # Generate timestamp (Unix timestamp in seconds)
         timestamp = str(int(time.time()))
-
-        # Canonicalize body as JSON (sorted keys, no spaces)
-        body_json = json.dumps(body, sort_keys=True, separators=(",", ":"))
-        body_hash = self._hash_body(body_json)
+        body_hash = hashlib.sha256(payload).hexdigest()
 
         # Create message to sign: METHOD + PATH + TIMESTAMP + BODY_HASH
-        message = f"{method}{path}{timestamp}{body_hash}"
+        message = b"".join(
+            (
+                method.encode("ascii"),
+                path.encode("ascii"),
+                timestamp.encode("ascii"),
+                body_hash.encode("ascii"),
+            )
+        )
 
         # Sign the message
-        signed = self.signing_key.sign(
-            message.encode("utf-8"), encoder=nacl.encoding.HexEncoder
-        )
-        signature = signed.signature.decode("utf-8")  # Extract just the signature part
+        signature = _encode_signature(self._sign(message))
 
         return self.did, timestamp, signature
 
-    def _hash_body(self, body_json: str) -> str:
-        """Hash the request body using SHA-256."""
-        return hashlib.sha256(body_json.encode("utf-8")).hexdigest()
-
     @staticmethod
     def from_did(did: str) -> "AgentWallet":
         """
@@ -128,19 +183,23 @@ class AgentWallet:
         public_key_hex = did[8:]  # Remove "did:key:" prefix
         return AgentWallet(public_key_hex=public_key_hex)
 
-    def verify_signature(self, message: str, signature_hex: str) -> bool:
+    def verify_signature(self, message: str, signature: str) -> bool:
         """
         Verify a signature using this agent's public key.
 
         Args:
             message: Original message that was signed
-            signature_hex: Hex-encoded signature
+            signature: base64url-encoded signature (hex is still accepted)
 
         Returns:
             True if signature is valid, False otherwise
         """
+        # Malformed input never reaches the decoder or the curve code
+        if len(signature) not in (_BASE64URL_SIGNATURE_LENGTH, _HEX_SIGNATURE_LENGTH):
+            return False
+
         try:
-            signature_bytes = bytes.fromhex(signature_hex)
+            signature_bytes = _decode_signature(signature)
             self.verify_key.verify(message.encode("utf-8"), signature_bytes)
             return True
         except nacl.exceptions.BadSignatureError:
@@ -149,6 +208,28 @@ class AgentWallet:
             return False
 
 
+def canonical_json(body: dict[str, Any]) -> bytes:
+    """
+    Serialize a request body the way the Gateway canonicalizes it.
+
+    Sorted keys, no whitespace and ASCII escaping must match the Gateway's
+    ``json.dumps`` call byte for byte, otherwise the body hash differs.
+    """
+    return json.dumps(body, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def _encode_signature(signature: bytes) -> str:
+    """Encode a raw Ed25519 signature for the X-Signature header (base64url)."""
+    return base64.urlsafe_b64encode(signature).rstrip(b"=").decode("ascii")
+
+
+def _decode_signature(signature: str) -> bytes:
+    """Decode an X-Signature value: unpadded base64url, or legacy hex."""
+    if len(signature) == _HEX_SIGNATURE_LENGTH:
+        return bytes.fromhex(signature)
+    return base64.urlsafe_b64decode(signature + "==")
+
+
 def generate_test_wallet() -> AgentWallet:
     """
     Generate a test wallet for development and testing.
@@ -158,7 +239,8 @@ def generate_test_wallet() -> AgentWallet:
     """
     # This is a test wallet - in production, each agent should generate their own
     wallet = AgentWallet()
-    print("🔑 Generated test wallet:")
-    print(f"   DID: {wallet.did}")
-    print(f"   Public Key: {wallet.public_key_hex}")
+    # Never print: stdout carries the MCP stdio transport
+    logger.info(
+        "Generated test wallet: did=%s public_key=%s", wallet.did, wallet.public_key_hex
+    )
     return wallet
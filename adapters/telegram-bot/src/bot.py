@@ -1,5 +1,13 @@
+import asyncio
+import re
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+import structlog
 from aiogram import F, Router
-from aiogram.filters import Command, CommandObject
+from aiogram.enums import ChatAction
+from aiogram.filters import Command, CommandObject, Filter
+from aiogram.filters.callback_data import CallbackData
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
 from aiogram.types import (
@@ -11,13 +19,61 @@ from aiogram.types import (
 
 from src.interfaces import NegotiationProvider
 
+logger = structlog.get_logger()
+
 router = Router()
 
+T = TypeVar("T")
+
+BID_RE = re.compile(r"\A\d+(?:\.\d+)?\Z")
+
+# Static keyboard, built once rather than per accepted deal
+_PAY_STUB_MARKUP = InlineKeyboardMarkup(
+    inline_keyboard=[
+        [InlineKeyboardButton(text="Pay Now (Stub)", callback_data="pay_stub")]
+    ]
+)
+
+
+class BidFilter(Filter):
+    """Match numeric bids and pass the parsed amount to the handler."""
+
+    async def __call__(self, message: Message) -> bool | dict[str, Any]:
+        if message.text and BID_RE.match(message.text):
+            return {"bid_amount": float(message.text)}
+        return False
+
+
+# TypeVar rather than PEP 695 syntax: the bot still supports Python 3.11
+async def _while_typing(message: Message, call: Awaitable[T]) -> T:  # noqa: UP047
+    """Await call while the typing indicator is sent to the chat."""
+    if message.bot is None:
+        # Detached message (no bot bound): nothing to show the indicator with
+        return await call
+
+    typing, result = await asyncio.gather(
+        message.bot.send_chat_action(message.chat.id, ChatAction.TYPING),
+        call,
+        return_exceptions=True,
+    )
+    # A failed typing indicator is cosmetic; a failed call is not
+    if isinstance(typing, BaseException):
+        logger.warning(
+            "typing_indicator_failed", chat_id=message.chat.id, error=str(typing)
+        )
+    if isinstance(result, BaseException):
+        raise result
+    return result
+
 
 class NegotiationStates(StatesGroup):
     WaitingForBid = State()
 
 
+class SelectHotel(CallbackData, prefix="select"):
+    item_id: str
+
+
 @router.message(Command("start"))
 async def cmd_start(message: Message) -> None:
     await message.answer(
@@ -35,100 +91,131 @@ async def cmd_search(
         await message.answer("Usage: /search <query>")
         return
 
-    results = await client.search(command.args)
+    results = await _while_typing(message, client.search(command.args))
     if not results:
         await message.answer("No results found or core-service unreachable. 😕")
         return
 
+    # User requirement: select:hotel_alpha
     keyboard = []
     for item in results:
-        # User requirement: select:hotel_alpha
-        item_id = item.get("itemId", item.get("item_id"))
-        name = item.get("name", "Unknown")
-        price = item.get("basePrice", item.get("base_price", 0))
-
+        try:
+            callback_data = SelectHotel(item_id=item["item_id"]).pack()
+        except ValueError:
+            # IDs containing ":" or over Telegram's 64-byte callback limit
+            # cannot be packed; truncating would select the wrong item
+            logger.warning("search_result_unselectable", item_id=item["item_id"])
+            continue
         keyboard.append(
             [
                 InlineKeyboardButton(
-                    text=f"{name} (${price})", callback_data=f"select:{item_id}"
+                    text=f"{item['name']} (${item['base_price']})",
+                    callback_data=callback_data,
                 )
             ]
         )
+    if not keyboard:
+        await message.answer("No results found or core-service unreachable. 😕")
+        return
 
     markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
     await message.answer("Choose a hotel to negotiate:", reply_markup=markup)
 
 
-@router.callback_query(F.data.startswith("select:"))
-async def process_select_hotel(callback: CallbackQuery, state: FSMContext) -> None:
-    if not callback.data:
-        return
-    item_id = callback.data.split(":", 1)[1]
+@router.callback_query(SelectHotel.filter())
+async def process_select_hotel(
+    callback: CallbackQuery, callback_data: SelectHotel, state: FSMContext
+) -> None:
+    item_id = callback_data.item_id
 
     # We don't have the item name/price here easily unless we fetch or store it.
     # For now, let's just ask.
-    await state.update_data(item_id=item_id)
-    await state.set_state(NegotiationStates.WaitingForBid)
+    # State and data live under separate storage keys, so with a remote
+    # storage (e.g. Redis) both writes are issued concurrently
+    await asyncio.gather(
+        state.update_data(item_id=item_id),
+        state.set_state(NegotiationStates.WaitingForBid),
+    )
 
     if callback.message:
         await callback.message.answer(f"Enter your bid for this item (ID: {item_id}):")
     await callback.answer()
 
 
-@router.message(NegotiationStates.WaitingForBid, F.text.regexp(r"^\d+(\.\d+)?$"))
+async def _on_accepted(
+    message: Message, state: FSMContext, acc: dict[str, Any]
+) -> None:
+    final_price = acc.get("final_price")
+    code = acc.get("reservation_code")
+
+    await message.answer(
+        f"✅ **Deal!**\nFinal Price: ${final_price}\nCode: `{code}`",
+        reply_markup=_PAY_STUB_MARKUP,
+        parse_mode="Markdown",
+    )
+    await state.clear()
+
+
+async def _on_countered(
+    message: Message, state: FSMContext, cnt: dict[str, Any]
+) -> None:
+    price = cnt.get("proposed_price")
+    msg = cnt.get("human_message", "")
+
+    await message.answer(
+        f"⚠️ **Offer: ${price}**\n"
+        f"{msg}\n\n"
+        "You can enter a new bid or say /search to restart.",
+        parse_mode="Markdown",
+    )
+    # Stay in WaitingForBid state
+
+
+async def _on_ui_required(
+    message: Message, state: FSMContext, _: dict[str, Any]
+) -> None:
+    await message.answer("👮 Human check needed. Please wait for an agent.")
+    await state.clear()
+
+
+async def _on_rejected(message: Message, state: FSMContext, _: dict[str, Any]) -> None:
+    await message.answer("❌ Offer rejected. Try a higher bid.")
+
+
+OutcomeHandler = Callable[[Message, FSMContext, dict[str, Any]], Awaitable[None]]
+
+# Checked in priority order; the first populated outcome wins
+_OUTCOME_HANDLERS: tuple[tuple[str, OutcomeHandler], ...] = (
+    ("accepted", _on_accepted),
+    ("countered", _on_countered),
+    ("ui_required", _on_ui_required),
+    ("rejected", _on_rejected),
+)
+
+
+@router.message(NegotiationStates.WaitingForBid, BidFilter())
 async def process_bid(
-    message: Message, state: FSMContext, client: NegotiationProvider
+    message: Message,
+    state: FSMContext,
+    client: NegotiationProvider,
+    bid_amount: float,
 ) -> None:
     data = await state.get_data()
     item_id = str(data.get("item_id", ""))
 
-    try:
-        bid_amount = float(message.text) if message.text else 0.0
-    except ValueError:
-        await message.answer("Please enter a valid number.")
-        return
-
-    response = await client.negotiate(item_id, bid_amount)
+    response = await _while_typing(message, client.negotiate(item_id, bid_amount))
 
     if "error" in response:
         await message.answer(str(response.get("error", "Unknown error")))
         return
 
-    if "accepted" in response and response["accepted"] is not None:
-        acc = response["accepted"]
-        final_price = acc.get("finalPrice", acc.get("final_price"))
-        code = acc.get("reservationCode", acc.get("reservation_code"))
+    for outcome, handler in _OUTCOME_HANDLERS:
+        payload = response.get(outcome)
+        if isinstance(payload, dict):
+            await handler(message, state, payload)
+            return
 
-        keyboard = [
-            [InlineKeyboardButton(text="Pay Now (Stub)", callback_data="pay_stub")]
-        ]
-        markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
-
-        await message.answer(
-            f"✅ **Deal!**\nFinal Price: ${final_price}\nCode: `{code}`",
-            reply_markup=markup,
-            parse_mode="Markdown",
-        )
-        await state.clear()
-    elif "countered" in response and response["countered"] is not None:
-        cnt = response["countered"]
-        price = cnt.get("proposedPrice", cnt.get("proposed_price"))
-        msg = cnt.get("humanMessage", cnt.get("human_message", ""))
-
-        await message.answer(
-            f"⚠️ **Offer: ${price}**\n"
-            f"{msg}\n\n"
-            "You can enter a new bid or say /search to restart.",
-            parse_mode="Markdown",
-        )
-        # Stay in WaitingForBid state
-    elif "ui_required" in response:
-        await message.answer("👮 Human check needed. Please wait for an agent.")
-        await state.clear()
-    elif "rejected" in response:
-        await message.answer("❌ Offer rejected. Try a higher bid.")
-    else:
-        await message.answer("Received an unknown response from Aura Core.")
+    await message.answer("Received an unknown response from Aura Core.")
 
 
 @router.callback_query(F.data == "pay_stub")
@@ -1,4 +1,5 @@
-import uuid
+import asyncio
+import secrets
 
 import grpc
 import structlog
@@ -9,30 +10,72 @@ from src.interfaces import NegotiationProvider, NegotiationResult, SearchResult
 
 logger = structlog.get_logger()
 
+# One channel per core-service address for the lifetime of the process
+_channels: dict[str, grpc.aio.Channel] = {}
+
+# Keep the HTTP/2 connection alive between chat bursts instead of letting
+# idle connections be reaped and re-handshaked on the next request. The
+# core-service server is configured to permit these idle pings.
+_CHANNEL_OPTIONS = [
+    ("grpc.keepalive_time_ms", 30000),
+    ("grpc.keepalive_timeout_ms", 10000),
+    ("grpc.keepalive_permit_without_calls", 1),
+    ("grpc.http2.max_pings_without_data", 0),
+    ("grpc.use_local_subchannel_pool", 1),
+]
+
+
+def get_channel(grpc_url: str) -> grpc.aio.Channel:
+    """Return the shared channel for grpc_url, creating it on first use."""
+    channel = _channels.get(grpc_url)
+    if channel is None:
+        channel = _channels[grpc_url] = grpc.aio.insecure_channel(
+            grpc_url, options=_CHANNEL_OPTIONS
+        )
+    return channel
+
 
 class GRPCNegotiationClient(NegotiationProvider):
-    def __init__(self, grpc_url: str, timeout: float = 30.0) -> None:
-        self.channel = grpc.aio.insecure_channel(grpc_url)
+    def __init__(
+        self,
+        grpc_url: str,
+        search_timeout: float = 5.0,
+        negotiate_timeout: float = 30.0,
+        channel: grpc.aio.Channel | None = None,
+    ) -> None:
+        self.grpc_url = grpc_url
+        # Static context is bound once so hot paths only carry dynamic fields
+        self.log = logger.bind(component="grpc_negotiation", grpc_url=grpc_url)
+        self.channel = channel or get_channel(grpc_url)
         self.stub = negotiation_pb2_grpc.NegotiationServiceStub(self.channel)
-        self.timeout = timeout
+        self._search_timeout = search_timeout
+        self._negotiate_timeout = negotiate_timeout
 
     async def search(self, query: str, limit: int = 5) -> list[SearchResult]:
         try:
             request = negotiation_pb2.SearchRequest(query=query, limit=limit)
-            response = await self.stub.Search(request, timeout=self.timeout)
-            # Use preserving_proto_field_name=True to get snake_case as per SearchResult TypedDict
+            response = await self.stub.Search(request, timeout=self._search_timeout)
+            if not response.results:
+                return []
+            # Read fields straight off the messages; MessageToDict would walk
+            # the descriptor and JSON-convert every field of every result
             return [
-                dict(MessageToDict(item, preserving_proto_field_name=True))  # type: ignore
+                SearchResult(
+                    item_id=item.item_id,
+                    name=item.name,
+                    base_price=item.base_price,
+                    description_snippet=item.description_snippet or None,
+                )
                 for item in response.results
             ]
         except grpc.RpcError as e:
-            logger.error("gRPC Search failed", code=e.code(), details=e.details())
+            self.log.error("search_failed", code=e.code(), details=e.details())
             return []
 
     async def negotiate(self, item_id: str, bid: float) -> NegotiationResult:
         try:
             request = negotiation_pb2.NegotiateRequest(
-                request_id=str(uuid.uuid4()),
+                request_id=secrets.token_hex(16),
                 item_id=item_id,
                 bid_amount=bid,
                 currency_code="USD",
@@ -40,10 +83,27 @@ class GRPCNegotiationClient(NegotiationProvider):
                     did="did:aura:telegram-bot", reputation_score=1.0
                 ),
             )
-            response = await self.stub.Negotiate(request, timeout=self.timeout)
-            return dict(MessageToDict(response, preserving_proto_field_name=True))  # type: ignore
+            response = await self.stub.Negotiate(
+                request, timeout=self._negotiate_timeout
+            )
+            # Only the populated oneof branch matters to the bot
+            result = response.WhichOneof("result")
+            if result is None:
+                return {}
+            payload = MessageToDict(
+                getattr(response, result), preserving_proto_field_name=True
+            )
+            if result == "accepted":
+                return {"accepted": payload}
+            if result == "countered":
+                return {"countered": payload}
+            if result == "rejected":
+                return {"rejected": payload}
+            if result == "ui_required":
+                return {"ui_required": payload}
+            return {}
         except grpc.RpcError as e:
-            logger.error("gRPC Negotiate failed", code=e.code(), details=e.details())
+            self.log.error("negotiate_failed", code=e.code(), details=e.details())
             if e.code() == grpc.StatusCode.UNAVAILABLE:
                 return {
                     "error": "Core service is currently unavailable. Please try again later."
@@ -52,5 +112,16 @@ class GRPCNegotiationClient(NegotiationProvider):
                 return {"error": "Request timed out. Please try again."}
             return {"error": f"An error occurred: {e.details()}"}
 
+    async def wait_ready(self, timeout: float) -> bool:
+        """Connect the channel ahead of the first request."""
+        try:
+            await asyncio.wait_for(self.channel.channel_ready(), timeout=timeout)
+            return True
+        except TimeoutError:
+            self.log.warning("channel_not_ready")
+            return False
+
     async def close(self) -> None:
+        if _channels.get(self.grpc_url) is self.channel:
+            del _channels[self.grpc_url]
         await self.channel.close()
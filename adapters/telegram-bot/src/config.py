@@ -14,13 +14,14 @@ class TelegramSettings(BaseSettings):
 
     token: SecretStr = Field("")  # type: ignore
     core_url: str = "core-service:50051"
+    # Per-RPC deadlines (seconds); negotiation may wait on an LLM strategy
+    search_timeout: float = 5.0
     negotiation_timeout: float = 30.0
+    connect_timeout: float = 5.0
+    http_pool_limit: int = 50
     webhook_domain: str | None = None
 
 
 @lru_cache
 def get_settings() -> TelegramSettings:
     return TelegramSettings()  # type: ignore
-
-
-settings = get_settings()
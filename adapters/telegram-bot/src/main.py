@@ -1,11 +1,13 @@
 import asyncio
+import logging
 
 import structlog
 from aiogram import Bot, Dispatcher
+from aiogram.client.session.aiohttp import AiohttpSession
 
 from src.bot import router
 from src.client import GRPCNegotiationClient
-from src.config import settings
+from src.config import get_settings
 
 # Setup logging
 structlog.configure(
@@ -13,23 +15,47 @@ structlog.configure(
         structlog.processors.TimeStamper(fmt="iso"),
         structlog.processors.add_log_level,
         structlog.processors.JSONRenderer(),
-    ]
+    ],
+    # Calls below INFO become no-ops instead of running the processor chain
+    wrapper_class=structlog.make_filtering_bound_logger(logging.INFO),
+    cache_logger_on_first_use=True,
 )
 logger = structlog.get_logger()
 
 
-async def main() -> None:
-    # Initialize gRPC client
+async def on_startup(dispatcher: Dispatcher) -> None:
+    settings = get_settings()
+    # One gRPC client (and channel) for the whole bot lifetime, injected
+    # into handlers through the dispatcher's workflow data
     client = GRPCNegotiationClient(
-        settings.core_url, timeout=settings.negotiation_timeout
+        settings.core_url,
+        search_timeout=settings.search_timeout,
+        negotiate_timeout=settings.negotiation_timeout,
     )
+    # Pay the connection handshake now rather than on the first user request
+    await client.wait_ready(timeout=settings.connect_timeout)
+    dispatcher["client"] = client
+
+
+async def on_shutdown(dispatcher: Dispatcher) -> None:
+    client: GRPCNegotiationClient | None = dispatcher.workflow_data.pop("client", None)
+    if client:
+        await client.close()
+
+
+async def main() -> None:
+    settings = get_settings()
 
     # Initialize Bot and Dispatcher
-    bot = Bot(token=settings.token.get_secret_value())
+    # Size the Telegram API connection pool for bursts of replies
+    session = AiohttpSession(limit=settings.http_pool_limit)
+    bot = Bot(token=settings.token.get_secret_value(), session=session)
     dp = Dispatcher()
 
-    # Register router
+    # Register router and lifecycle hooks
     dp.include_router(router)
+    dp.startup.register(on_startup)
+    dp.shutdown.register(on_shutdown)
 
     logger.info(
         "Starting Aura Telegram Bot",
@@ -37,12 +63,10 @@ async def main() -> None:
     )
 
     try:
-        # Pass client as dependency to handlers
-        await dp.start_polling(bot, client=client)
+        await dp.start_polling(bot)
     except Exception as e:
         logger.error("Bot crashed", error=str(e))
     finally:
-        await client.close()
         await bot.session.close()
 
 
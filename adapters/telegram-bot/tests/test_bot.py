@@ -1,9 +1,11 @@
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock
 
 import pytest
 from aiogram.filters import CommandObject
 from src.bot import (
+    BidFilter,
     NegotiationStates,
+    SelectHotel,
     cmd_search,
     cmd_start,
     process_bid,
@@ -20,8 +22,7 @@ async def test_cmd_start(message):
 
 @pytest.mark.asyncio
 async def test_cmd_search_results(message, mock_client):
-    command = MagicMock(spec=CommandObject)
-    command.args = "Paris"
+    command = CommandObject(command="search", args="Paris")
 
     mock_client.search_results = [
         {"item_id": "hotel_1", "name": "Hotel Alpha", "base_price": 100.0}
@@ -39,6 +40,35 @@ async def test_cmd_search_results(message, mock_client):
     assert len(keyboard) == 1
     assert keyboard[0][0].text == "Hotel Alpha ($100.0)"
     assert keyboard[0][0].callback_data == "select:hotel_1"
+    message.bot.send_chat_action.assert_awaited_once_with(123, "typing")
+
+
+@pytest.mark.asyncio
+async def test_cmd_search_skips_unpackable_ids(message, mock_client):
+    command = CommandObject(command="search", args="Paris")
+
+    mock_client.search_results = [
+        {"item_id": "hotel:1", "name": "Colon Inn", "base_price": 80.0},
+        {"item_id": "h" * 64, "name": "Long Stay", "base_price": 90.0},
+        {"item_id": "hotel_2", "name": "Hotel Beta", "base_price": 100.0},
+    ]
+
+    await cmd_search(message, command, mock_client)
+
+    # Only the ID that fits a callback payload gets a button
+    keyboard = message.answer.call_args.kwargs["reply_markup"].inline_keyboard
+    assert [row[0].callback_data for row in keyboard] == ["select:hotel_2"]
+
+
+@pytest.mark.asyncio
+async def test_cmd_search_without_bot(message, mock_client):
+    command = CommandObject(command="search", args="Paris")
+    message.bot = None
+
+    await cmd_search(message, command, mock_client)
+
+    # No bot to send the typing indicator with; the search still runs
+    assert "No results found" in message.answer.call_args[0][0]
 
 
 @pytest.mark.asyncio
@@ -46,7 +76,8 @@ async def test_process_select_hotel(callback_query):
     callback_query.data = "select:hotel_1"
     state = AsyncMock()
 
-    await process_select_hotel(callback_query, state)
+    callback_data = SelectHotel.unpack(callback_query.data)
+    await process_select_hotel(callback_query, callback_data, state)
 
     state.update_data.assert_called_with(item_id="hotel_1")
     state.set_state.assert_called_with(NegotiationStates.WaitingForBid)
@@ -64,10 +95,41 @@ async def test_process_bid_accepted(message, mock_client):
         "accepted": {"final_price": 90.0, "reservation_code": "SUCCESS123"}
     }
 
-    await process_bid(message, state, mock_client)
+    await process_bid(message, state, mock_client, bid_amount=90.0)
 
     message.answer.assert_called()
     args, kwargs = message.answer.call_args
     assert "Deal!" in args[0]
     assert "SUCCESS123" in args[0]
     state.clear.assert_called()
+    message.bot.send_chat_action.assert_awaited_once_with(123, "typing")
+
+
+@pytest.mark.asyncio
+async def test_process_bid_countered(message, mock_client):
+    state = AsyncMock()
+    state.get_data.return_value = {"item_id": "hotel_1"}
+
+    mock_client.negotiation_result = {
+        "accepted": None,
+        "countered": {"proposed_price": 95.0, "human_message": "Meet me halfway"},
+    }
+
+    await process_bid(message, state, mock_client, bid_amount=90.0)
+
+    args, _ = message.answer.call_args
+    assert "Offer: $95.0" in args[0]
+    assert "Meet me halfway" in args[0]
+    state.clear.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_bid_filter(message):
+    bid_filter = BidFilter()
+
+    message.text = "90.5"
+    assert await bid_filter(message) == {"bid_amount": 90.5}
+
+    for text in ("abc", "90.", "-5", "90\n", None):
+        message.text = text
+        assert await bid_filter(message) is False
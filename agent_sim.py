@@ -1,21 +1,25 @@
+import asyncio
 import os
 import time
 
-import requests
+import httpx
 from dotenv import load_dotenv
 
-from agent_identity import AgentWallet
+from agent_identity import AgentWallet, canonical_json
 
 load_dotenv()
 
 GATEWAY_URL = os.getenv("AURA_GATEWAY_URL", "http://localhost:8000")
+# Set AURA_SIM_VERBOSE=0 to print only errors, e.g. when driving load
+VERBOSE = os.getenv("AURA_SIM_VERBOSE", "1") != "0"
 
 
-def run_agent_scenario(scenario_name, item_id, bid, wallet=None):
+async def run_agent_scenario(client, scenario_name, item_id, bid, wallet=None):
     """
     Run a negotiation scenario with cryptographic signing.
 
     Args:
+        client: Shared httpx.AsyncClient pointed at the gateway
         scenario_name: Name of the scenario
         item_id: ID of the item to negotiate
         bid: Bid amount
@@ -24,11 +28,8 @@ def run_agent_scenario(scenario_name, item_id, bid, wallet=None):
     # If no wallet provided, create a new one
     if wallet is None:
         wallet = AgentWallet()
-        print(f"Generated new agent wallet: {wallet.did}")
-
-    print(f"\n--- 🤖 SCENARIO: {scenario_name} ---")
-    print(f"Target: {item_id} | Bid: ${bid}")
-    print(f"Agent: {wallet.did}")
+        if VERBOSE:
+            print(f"Generated new agent wallet: {wallet.did}")
 
     payload = {
         "item_id": item_id,
@@ -41,9 +42,10 @@ def run_agent_scenario(scenario_name, item_id, bid, wallet=None):
         start_ts = time.time()
         method = "/v1/negotiate"
 
-        # Sign the request
-        x_agent_id, x_timestamp, x_signature = wallet.sign_request(
-            "POST", method, payload
+        # Serialize once and send exactly the bytes that were signed
+        body = canonical_json(payload)
+        x_agent_id, x_timestamp, x_signature = wallet.sign_request_bytes(
+            "POST", method, body
         )
 
         # Add headers to the request
@@ -51,20 +53,26 @@ def run_agent_scenario(scenario_name, item_id, bid, wallet=None):
             "X-Agent-ID": x_agent_id,
             "X-Timestamp": x_timestamp,
             "X-Signature": x_signature,
-            "Content-Type": "application/json",
         }
 
-        response = requests.post(
-            f"{GATEWAY_URL}{method}", json=payload, headers=headers, timeout=30
-        )
+        response = await client.post(method, content=body, headers=headers)
         latency = (time.time() - start_ts) * 1000
 
-        print(f"⏱️  Latency[{GATEWAY_URL}]: {latency:.2f}ms")
+        # Scenarios run concurrently: print each one's block only once its
+        # response is in, so the output of different scenarios never interleaves
+        if VERBOSE:
+            print(f"\n--- 🤖 SCENARIO: {scenario_name} ---")
+            print(f"Target: {item_id} | Bid: ${bid}")
+            print(f"Agent: {wallet.did}")
+            print(f"⏱️  Latency[{GATEWAY_URL}]: {latency:.2f}ms")
 
         if response.status_code != 200:
             print(f"❌ Error {response.status_code}: {response.text}")
             return
 
+        if not VERBOSE:
+            return
+
         data = response.json()
         status = data.get("status")
 
@@ -92,24 +100,36 @@ def run_agent_scenario(scenario_name, item_id, bid, wallet=None):
                 print(f"   Code: {data['data']['reason_code']}")
 
     except Exception as e:
-        print(f"🔥 System Error: {e}")
+        print(f"🔥 System Error [{scenario_name}]: {e}")
 
 
-if __name__ == "__main__":
+async def main():
     # Create a wallet for all scenarios
     wallet = AgentWallet()
     print(f"🔑 Using agent wallet: {wallet.did}")
     print(f"🔑 Public key: {wallet.public_key_hex}")
 
-    # 1. Жадный агент (слишком дешево)
-    # floor_price у hotel_alpha = 800
-    run_agent_scenario("Greedy Agent", "hotel_alpha", 1.0, wallet)
-
-    # 2. Умный агент (в рамках допустимого)
-    run_agent_scenario("Smart Agent", "hotel_alpha", 850.0, wallet)
+    # The scenarios are independent, so their round-trips overlap on one
+    # keep-alive connection pool instead of running back to back
+    async with httpx.AsyncClient(
+        base_url=GATEWAY_URL,
+        headers={"Content-Type": "application/json"},
+        timeout=30,
+    ) as client:
+        await asyncio.gather(
+            # 1. Жадный агент (слишком дешево)
+            # floor_price у hotel_alpha = 800
+            run_agent_scenario(client, "Greedy Agent", "hotel_alpha", 1.0, wallet),
+            # 2. Умный агент (в рамках допустимого)
+            run_agent_scenario(client, "Smart Agent", "hotel_alpha", 850.0, wallet),
+            # 3. Богатый агент (Триггер UI подтверждения > 1000)
+            run_agent_scenario(
+                client, "High-Roller Agent", "hotel_alpha", 1200.0, wallet
+            ),
+            # 4. Ошибка (товар не существует)
+            run_agent_scenario(client, "Lost Agent", "hotel_omega_999", 100.0, wallet),
+        )
 
-    # 3. Богатый агент (Триггер UI подтверждения > 1000)
-    run_agent_scenario("High-Roller Agent", "hotel_alpha", 1200.0, wallet)
 
-    # 4. Ошибка (товар не существует)
-    run_agent_scenario("Lost Agent", "hotel_omega_999", 100.0, wallet)
+if __name__ == "__main__":
+    asyncio.run(main())
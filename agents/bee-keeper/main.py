@@ -4,7 +4,7 @@ import sys
 import structlog
 
 from src.aggregator import BeeAggregator
-from src.config import KeeperSettings
+from src.config import get_settings
 from src.connector import BeeConnector
 from src.generator import BeeGenerator
 from src.metabolism import BeeMetabolism
@@ -24,7 +24,7 @@ async def main() -> None:
     logger.info("bee_keeper_agent_starting")
 
     # 0. Load Settings
-    settings = KeeperSettings()
+    settings = get_settings()
 
     # 1. Initialize Nucleotides
     aggregator = BeeAggregator(settings=settings)
@@ -51,6 +51,8 @@ async def main() -> None:
     except Exception as e:
         logger.error("bee_keeper_agent_critical_error", error=str(e), exc_info=True)
         sys.exit(1)
+    finally:
+        await connector.aclose()
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -1,8 +1,10 @@
+import asyncio
 import json
 import os
 import subprocess  # nosec
-from pathlib import Path
+from collections.abc import Iterator
 from typing import Any
+from urllib.parse import urlencode
 
 import httpx
 import structlog
@@ -12,6 +14,15 @@ from src.dna import BeeContext
 
 logger = structlog.get_logger(__name__)
 
+_REPO_ROOT = "../../"
+_EXCLUDED_DIRS = frozenset({".venv", "proto"})
+_SUCCESS_RATE_QUERY = urlencode(
+    {
+        "query": "sum(rate(negotiation_accepted_total[5m]))"
+        " / sum(rate(negotiation_total[5m]))"
+    }
+)
+
 
 class BeeAggregator:
     """A - Aggregator: Gathers signals from Git, Prometheus, and Filesystem."""
@@ -19,16 +30,34 @@ class BeeAggregator:
     def __init__(self, settings: KeeperSettings) -> None:
         self.settings = settings
         self.prometheus_url = settings.prometheus_url
+        # The query never changes, so the request URL is encoded once
+        self._success_rate_url = (
+            f"{self.prometheus_url}/api/v1/query?{_SUCCESS_RATE_QUERY}"
+        )
         self.repo_name = settings.github_repository
         self.event_path = settings.github_event_path
 
     async def perceive(self) -> BeeContext:
         logger.info("bee_aggregator_perceive_started")
 
-        git_diff = await self._get_git_diff()
-        hive_metrics = await self._get_hive_metrics()
-        filesystem_map = self._scan_filesystem()
-        event_data = self._load_event_data()
+        if self.settings.github_event_name == "schedule":
+            # Heartbeats skip the audit, so only the hive metrics are needed
+            return BeeContext(
+                git_diff="",
+                hive_metrics=await self._get_hive_metrics(),
+                filesystem_map=(),
+                repo_name=self.repo_name,
+                event_name="schedule",
+            )
+
+        # Disk-bound work goes to threads and is started first, so it overlaps
+        # with the Prometheus query and the git call
+        filesystem_map, event_data, hive_metrics, git_diff = await asyncio.gather(
+            asyncio.to_thread(self._scan_filesystem),
+            asyncio.to_thread(self._load_event_data),
+            self._get_hive_metrics(),
+            self._get_git_diff(),
+        )
 
         return BeeContext(
             git_diff=git_diff,
@@ -42,35 +71,32 @@ class BeeAggregator:
     async def _get_git_diff(self) -> str:
         try:
             # Try to get diff between HEAD~1 and HEAD
-            result = subprocess.run(
-                ["git", "diff", "--unified=0", "HEAD~1", "HEAD"],
-                capture_output=True,
-                text=True,
-                check=False
-            ) # nosec
-            if result.returncode == 0:
-                return result.stdout
+            returncode, diff = await self._run_git("diff", "--unified=0", "HEAD~1", "HEAD")
+            if returncode == 0:
+                return diff
 
             # Fallback for shallow clones or initial commit
-            result = subprocess.run(
-                ["git", "show", "--unified=0", "HEAD"],
-                capture_output=True,
-                text=True,
-                check=False
-            ) # nosec
-            return result.stdout
+            _, diff = await self._run_git("show", "--unified=0", "HEAD")
+            return diff
         except Exception as e:
             logger.warning("git_diff_failed", error=str(e))
             return ""
 
+    async def _run_git(self, *args: str) -> tuple[int | None, str]:
+        # Non-blocking for the event loop; output is decoded once
+        proc = await asyncio.create_subprocess_exec(
+            "git",
+            *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )  # nosec
+        stdout, _ = await proc.communicate()
+        return proc.returncode, stdout.decode("utf-8", "replace")
+
     async def _get_hive_metrics(self) -> dict[str, Any]:
-        query = 'sum(rate(negotiation_accepted_total[5m])) / sum(rate(negotiation_total[5m]))'
         try:
             async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(
-                    f"{self.prometheus_url}/api/v1/query",
-                    params={"query": query}
-                )
+                response = await client.get(self._success_rate_url)
                 response.raise_for_status()
                 data = response.json()
                 if data["status"] == "success" and data["data"]["result"]:
@@ -81,16 +107,35 @@ class BeeAggregator:
 
         return {"negotiation_success_rate": 0.0, "status": "UNKNOWN"}
 
-    def _scan_filesystem(self) -> list[str]:
-        filesystem_map = []
-        # Scan from repository root
-        root_path = Path("../../")
-        for path in root_path.rglob("*.py"):
-            if ".venv" not in path.parts and "proto" not in path.parts:
-                # Store path relative to root
-                rel_path = path.relative_to(root_path)
-                filesystem_map.append(str(rel_path))
-        return filesystem_map
+    def _scan_filesystem(self) -> tuple[str, ...]:
+        # Git already indexes the tracked files; fall back to a walk outside a repo
+        try:
+            result = subprocess.run(
+                ["git", "-C", _REPO_ROOT, "ls-files", "-z", "*.py"],
+                capture_output=True,
+                check=True
+            ) # nosec
+        except (OSError, subprocess.CalledProcessError) as e:
+            logger.warning("git_ls_files_failed", error=str(e))
+            return tuple(self._iter_python_files())
+        return tuple(
+            path
+            for path in result.stdout.decode().split("\0")
+            if path and _EXCLUDED_DIRS.isdisjoint(path.split("/"))
+        )
+
+    def _iter_python_files(self) -> Iterator[str]:
+        # Scan from repository root, pruning excluded directories as a whole
+        stack = [_REPO_ROOT]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in _EXCLUDED_DIRS:
+                            stack.append(entry.path)
+                    elif entry.name.endswith(".py") and entry.is_file():
+                        # Yield path relative to root
+                        yield os.path.relpath(entry.path, _REPO_ROOT)
 
     def _load_event_data(self) -> dict[str, Any]:
         if self.event_path and os.path.exists(self.event_path):
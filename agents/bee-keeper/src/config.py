@@ -1,3 +1,8 @@
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+import yaml  # type: ignore
 from pydantic import AliasChoices, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -31,3 +36,30 @@ class KeeperSettings(BaseSettings):  # type: ignore
     github_event_name: str = Field("manual", alias="GITHUB_EVENT_NAME")
 
     max_tokens: int = Field(1000, alias="AURA_BEE_KEEPER__MAX_TOKENS")
+
+
+@lru_cache
+def get_settings() -> KeeperSettings:
+    return KeeperSettings()  # type: ignore
+
+
+# The prompt and manifest are read-only for the life of the process, so the
+# Transformer and Generator share one parsed copy
+@lru_cache
+def load_persona() -> str:
+    prompt_path = Path("prompts/bee_keeper.md")
+    return (
+        prompt_path.read_text()
+        if prompt_path.exists()
+        else "You are bee.Keeper, guardian of the Aura Hive."
+    )
+
+
+@lru_cache
+def load_manifest() -> dict[str, Any]:
+    manifest_path = Path("hive-manifest.yaml")
+    if not manifest_path.exists():
+        return {}
+    with open(manifest_path) as f:
+        manifest: dict[str, Any] = yaml.safe_load(f)
+    return manifest
@@ -1,14 +1,14 @@
 import asyncio
 import json
-from typing import Any
 
 import nats
+import nats.aio.client
 import nats.errors
 import structlog
-from github import Github
 
 from src.config import KeeperSettings
 from src.dna import BeeContext, BeeObservation, PurityReport
+from src.github_client import GitHubClient
 
 logger = structlog.get_logger(__name__)
 
@@ -22,23 +22,37 @@ class BeeConnector:
         self.repo_name = settings.github_repository
         self.nats_url = settings.nats_url
 
-        self.gh = None
+        self.gh_client = None
         if self.github_token and self.github_token != "mock":  # nosec
-            self.gh = Github(self.github_token)
+            self.gh_client = GitHubClient(self.github_token)
+
+        # Connected on first emit and kept until aclose()
+        self._nc: nats.aio.client.Client | None = None
 
     async def act(self, report: PurityReport, context: BeeContext) -> BeeObservation:
         logger.info("bee_connector_act_started")
 
-        # 1. Post to GitHub (if not a heartbeat)
-        comment_url = ""
-        if context.event_name != "schedule":
-            comment_url = await self._post_to_github(report, context)
-
-        # 2. Commit Hive State (idempotency handled by Generator writing the file)
-        await self._commit_changes()
+        # GitHub, git and NATS are independent, so the three run concurrently
+        results = await asyncio.gather(
+            # 1. Post to GitHub (if not a heartbeat)
+            self._post_to_github(report, context)
+            if context.event_name != "schedule"
+            else self._skip_github_post(),
+            # 2. Commit Hive State (idempotency handled by Generator writing the file)
+            self._commit_changes(),
+            # 3. Emit NATS Event
+            self._emit_nats_event(report, context),
+            return_exceptions=True,
+        )
+        for step, result in zip(("github_post", "git_commit", "nats_emit"), results):
+            if isinstance(result, BaseException):
+                logger.error("bee_connector_step_failed", step=step, error=str(result))
 
-        # 3. Emit NATS Event
-        nats_sent = await self._emit_nats_event(report, context)
+        comment_url, _, nats_sent = results
+        if not isinstance(comment_url, str):
+            comment_url = ""
+        if not isinstance(nats_sent, bool):
+            nats_sent = False
 
         return BeeObservation(
             success=True,
@@ -46,79 +60,76 @@ class BeeConnector:
             nats_event_sent=nats_sent
         )
 
-    async def _commit_changes(self) -> None:
-        import subprocess  # nosec
-
-        def git_commit() -> None:
+    async def aclose(self) -> None:
+        """Release the connections held for GitHub and NATS."""
+        if self.gh_client:
+            await self.gh_client.aclose()
+        if self._nc is not None and not self._nc.is_closed:
             try:
-                # Check for changes
-                status = subprocess.run(
-                    ["git", "status", "--porcelain"],
-                    capture_output=True,
-                    text=True,
-                    check=False,
-                )  # nosec
-                if not status.stdout:
-                    logger.info("no_changes_to_commit")
-                    return
-
-                logger.info("committing_changes", files=status.stdout.splitlines())
-                subprocess.run(
-                    ["git", "add", "../../HIVE_STATE.md", "../../llms.txt"], check=False
-                )  # nosec
-                subprocess.run(
-                    [
-                        "git",
-                        "commit",
-                        "-m",
-                        "chore(hive): auto-update hive state [skip ci]",
-                    ],
-                    check=False,
-                )  # nosec
-                subprocess.run(["git", "push"], check=False)  # nosec
-                logger.info("changes_pushed_successfully")
-            except Exception as e:
-                logger.warning("git_commit_failed", error=str(e))
-
-        await asyncio.to_thread(git_commit)
+                # Drain delivers anything still buffered before closing
+                await self._nc.drain()
+            except nats.errors.Error as e:
+                logger.warning("nats_drain_failed", error=str(e))
+            self._nc = None
+
+    async def _skip_github_post(self) -> str:
+        # Heartbeats are not commented on; keeps the gather() shape fixed
+        return ""
+
+    async def _commit_changes(self) -> None:
+        try:
+            # Stage only the hive files; `git commit` itself reports whether
+            # they changed, so no separate `git status` scan is needed
+            await self._git("add", "../../HIVE_STATE.md", "../../llms.txt")
+            returncode = await self._git(
+                "commit", "-m", "chore(hive): auto-update hive state [skip ci]"
+            )
+            if returncode == 1:
+                logger.info("no_changes_to_commit")
+                return
+            if returncode != 0:
+                logger.warning("git_commit_failed", returncode=returncode)
+                return
+
+            await self._git("push")
+            logger.info("changes_pushed_successfully")
+        except Exception as e:
+            logger.warning("git_commit_failed", error=str(e))
+
+    async def _git(self, *args: str) -> int:
+        # Runs on the event loop; output goes straight to the job log
+        proc = await asyncio.create_subprocess_exec("git", *args)  # nosec
+        return await proc.wait()
 
     async def _post_to_github(self, report: PurityReport, context: BeeContext) -> str:
-        if not self.gh or not self.repo_name:
+        if not self.gh_client or not self.repo_name:
             logger.warning("github_client_not_initialized_skipping_post")
             return ""
 
-        # Capture repo_name and gh for the closure
-        repo_name: str = self.repo_name
-        gh = self.gh
-
-        def post() -> str:
-            try:
-                repo = gh.get_repo(repo_name)
-                message = self._format_github_message(report)
-
-                event_data = context.event_data
-                if "pull_request" in event_data:
-                    pr_num = event_data["pull_request"]["number"]
-                    comment: Any = repo.get_pull(pr_num).create_issue_comment(message)
-                    return str(comment.html_url)
-                else:
-                    sha = event_data.get("after")
-                    if not sha and "head_commit" in event_data:
-                        sha = event_data["head_commit"].get("id")
-
-                    if sha:
-                        comment = repo.get_commit(sha).create_comment(message)
-                        return str(comment.html_url)
-
+        message = self._format_github_message(report)
+        event_data = context.event_data
+        try:
+            # The target comes straight from the event payload, no lookups
+            if "pull_request" in event_data:
+                pr_num = event_data["pull_request"]["number"]
+                return await self.gh_client.post_comment(
+                    self.repo_name, message, issue_number=pr_num
+                )
+
+            sha = event_data.get("after")
+            if not sha and "head_commit" in event_data:
+                sha = event_data["head_commit"].get("id")
+
+            if not sha:
                 # Fallback
-                branch = repo.get_branch("main")
-                comment = branch.commit.create_comment(message)
-                return str(comment.html_url)
-            except Exception as e:
-                logger.error("github_post_failed", error=str(e))
-                return ""
+                sha = await self.gh_client.get_branch_sha(self.repo_name, "main")
 
-        return await asyncio.to_thread(post)
+            return await self.gh_client.post_comment(
+                self.repo_name, message, commit_sha=sha
+            )
+        except Exception as e:
+            logger.error("github_post_failed", error=str(e))
+            return ""
 
     def _format_github_message(self, report: PurityReport) -> str:
         status_emoji = "🍯" if report.is_pure else "⚠️"
@@ -139,10 +150,15 @@ class BeeConnector:
 
         return msg
 
+    async def _ensure_nc(self) -> nats.aio.client.Client:
+        if self._nc is None or self._nc.is_closed:
+            # Use connect_timeout to prevent hanging if NATS is unreachable
+            self._nc = await nats.connect(self.nats_url, connect_timeout=5.0)
+        return self._nc
+
     async def _emit_nats_event(self, report: PurityReport, context: BeeContext) -> bool:
         try:
-            # Use connect_timeout to prevent hanging if NATS is unreachable
-            nc = await nats.connect(self.nats_url, connect_timeout=5.0)
+            nc = await self._ensure_nc()
             payload = {
                 "agent": "bee.Keeper",
                 "is_pure": report.is_pure,
@@ -150,7 +166,8 @@ class BeeConnector:
                 "timestamp": asyncio.get_event_loop().time()
             }
             await nc.publish("aura.hive.audit", json.dumps(payload).encode())
-            await nc.close()
+            # Confirm the server has it without tearing the connection down
+            await nc.flush(timeout=5.0)
             return True
         except (nats.errors.NoServersError, nats.errors.TimeoutError, Exception) as e:
             # Log warning and return False to allow metabolic cycle to complete.
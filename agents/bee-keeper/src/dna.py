@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import Any, Protocol, runtime_checkable
+from typing import Any, Protocol
 
 
 @dataclass
@@ -7,7 +7,7 @@ class BeeContext:
     """Consolidated context for the BeeKeeper's audit."""
     git_diff: str
     hive_metrics: dict[str, Any]
-    filesystem_map: list[str]
+    filesystem_map: tuple[str, ...]
     repo_name: str
     event_name: str = "manual"
     event_data: dict[str, Any] = field(default_factory=dict)
@@ -35,25 +35,21 @@ class BeeObservation:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
-@runtime_checkable
 class BeeAggregator(Protocol):
     """A - Aggregator: Gathers signals from Git, Prometheus, and Filesystem."""
     async def perceive(self) -> BeeContext: ...
 
 
-@runtime_checkable
 class BeeTransformer(Protocol):
     """T - Transformer: Analyzes purity and generates reports."""
     async def think(self, context: BeeContext) -> PurityReport: ...
 
 
-@runtime_checkable
 class BeeConnector(Protocol):
     """C - Connector: Interacts with GitHub and NATS."""
     async def act(self, report: PurityReport, context: BeeContext) -> BeeObservation: ...
 
 
-@runtime_checkable
 class BeeGenerator(Protocol):
     """G - Generator: Updates documentation and chronicles."""
     async def generate(self, report: PurityReport, context: BeeContext) -> None: ...
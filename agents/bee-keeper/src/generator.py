@@ -1,13 +1,19 @@
+import asyncio
+import hashlib
+import re
 from pathlib import Path
 
 import litellm
 import structlog
 
-from src.config import KeeperSettings
+from src.config import KeeperSettings, load_persona
 from src.dna import BeeContext, PurityReport
 
 logger = structlog.get_logger(__name__)
 
+# Fingerprint of the Protobuf sources llms.txt was last synchronized from
+_PROTO_HASH_RE = re.compile(r"^<!-- proto-hash: ([0-9a-f]+) -->\n?", re.MULTILINE)
+
 
 class BeeGenerator:
     """G - Generator: Updates documentation and chronicles."""
@@ -16,12 +22,7 @@ class BeeGenerator:
         self.settings = settings
         self.model = settings.llm__model
         litellm.api_key = settings.llm__api_key
-        prompt_path = Path("prompts/bee_keeper.md")
-        self.persona = (
-            prompt_path.read_text()
-            if prompt_path.exists()
-            else "You are bee.Keeper, guardian of the Aura Hive."
-        )
+        self.persona = load_persona()
 
     async def generate(self, report: PurityReport, context: BeeContext) -> None:
         logger.info("bee_generator_generate_started")
@@ -36,12 +37,23 @@ class BeeGenerator:
 
     async def _update_llms_txt(self, context: BeeContext) -> None:
         llms_txt_path = Path("../../llms.txt")
-        current_llms_txt = llms_txt_path.read_text() if llms_txt_path.exists() else ""
+        # All disk reads in one worker-thread hop, off the event loop
+        current_llms_txt, protos = await asyncio.to_thread(
+            self._read_sources, llms_txt_path
+        )
+
+        # Skip the LLM when the Protobuf sources match the last synchronization
+        fingerprint = hashlib.blake2b()
+        for p, source in protos:
+            fingerprint.update(f"{p}\0{source}\0".encode())
+        proto_hash = fingerprint.hexdigest()
+        synced = _PROTO_HASH_RE.search(current_llms_txt)
+        if synced and synced.group(1) == proto_hash:
+            logger.info("llms_txt_already_synchronized")
+            return
+        current_llms_txt = _PROTO_HASH_RE.sub("", current_llms_txt).strip()
 
-        proto_files = list(Path("../../proto").rglob("*.proto"))
-        proto_contents = ""
-        for p in proto_files:
-            proto_contents += f"\n--- {p} ---\n{p.read_text()}\n"
+        proto_contents = "".join(f"\n--- {p} ---\n{source}\n" for p, source in protos)
 
         prompt = f"""
         {self.persona}
@@ -68,11 +80,22 @@ class BeeGenerator:
             if updated_content.startswith("```"):
                 updated_content = "\n".join(updated_content.splitlines()[1:-1])
 
-            llms_txt_path.write_text(updated_content.strip())
+            updated_content = _PROTO_HASH_RE.sub("", updated_content).strip()
+            llms_txt_path.write_text(
+                f"{updated_content}\n\n<!-- proto-hash: {proto_hash} -->\n"
+            )
             logger.info("llms_txt_synchronized")
         except Exception as e:
             logger.error("llms_txt_sync_failed", error=str(e))
 
+    def _read_sources(
+        self, llms_txt_path: Path
+    ) -> tuple[str, list[tuple[Path, str]]]:
+        current_llms_txt = llms_txt_path.read_text() if llms_txt_path.exists() else ""
+        proto_files = sorted(Path("../../proto").rglob("*.proto"))
+        protos = [(p, p.read_text()) for p in proto_files]
+        return current_llms_txt, protos
+
     async def _update_hive_state(self, report: PurityReport, context: BeeContext) -> None:
         state_path = Path("../../HIVE_STATE.md")
         current_content = state_path.read_text() if state_path.exists() else ""
@@ -98,14 +121,6 @@ class BeeGenerator:
         new_entry += f"\n<!-- metadata\nexecution_time: {report.execution_time:.2f}s\ntoken_usage: {report.token_usage}\nevent: {context.event_name}\n-->\n"
         new_entry += "\n---\n\n"
 
-        # Idempotency check (compare narrative and heresies)
-        if report.narrative in current_content and all(h in current_content for h in report.heresies):
-             # Also check if metrics changed significantly?
-             # For now, let's just check if the last entry is basically the same.
-             # Actually, just appending for now as chronicles should be a log.
-             # User said: "The Generator (G) must only produce a new version of HIVE_STATE.md if the actual metrics or task statuses have changed."
-             pass
-
         # To keep it simple and fulfill the log nature, we append, but we could replace the whole file
         # if we want a "current state" view. User said "update resource stats in HIVE_STATE.md".
         # Let's rebuild the file header + current status + audit log.
@@ -0,0 +1,92 @@
+import asyncio
+import time
+from typing import Any
+
+import httpx
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+GITHUB_API_URL = "https://api.github.com"
+# Longest rate-limit wait honoured before letting the request fail
+MAX_RATE_LIMIT_WAIT = 60.0
+
+
+class GitHubClient:
+    """Minimal async client for the GitHub REST endpoints the Keeper uses."""
+
+    def __init__(self, token: str, base_url: str = GITHUB_API_URL) -> None:
+        self.base_url = base_url
+        self.headers = {
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/vnd.github+json",
+            "X-GitHub-Api-Version": "2022-11-28",
+        }
+        # One pool for the client's lifetime: TLS and DNS are paid once
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=self.headers,
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=10),
+        )
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def _request(self, method: str, path: str, **kwargs: Any) -> Any:
+        response = await self._client.request(method, path, **kwargs)
+        wait = _rate_limit_wait(response)
+        if wait is not None and wait <= MAX_RATE_LIMIT_WAIT:
+            # Retry once after the wait GitHub asked for
+            logger.warning("github_rate_limited", path=path, wait_seconds=wait)
+            await asyncio.sleep(wait)
+            response = await self._client.request(method, path, **kwargs)
+        response.raise_for_status()
+        return response.json()
+
+    async def post_comment(
+        self,
+        repo: str,
+        body: str,
+        *,
+        issue_number: int | None = None,
+        commit_sha: str | None = None,
+    ) -> str:
+        """Comment on a pull request (issue) or a commit; returns the comment URL."""
+        if issue_number is not None:
+            path = f"/repos/{repo}/issues/{issue_number}/comments"
+        elif commit_sha:
+            path = f"/repos/{repo}/commits/{commit_sha}/comments"
+        else:
+            raise ValueError("Either issue_number or commit_sha is required")
+
+        comment = await self._request("POST", path, json={"body": body})
+        return str(comment["html_url"])
+
+    async def get_branch_sha(self, repo: str, branch: str) -> str:
+        """Return the SHA of the commit at the tip of ``branch``."""
+        data = await self._request("GET", f"/repos/{repo}/branches/{branch}")
+        return str(data["commit"]["sha"])
+
+
+def _rate_limit_wait(response: httpx.Response) -> float | None:
+    """Seconds GitHub asks to wait before retrying, or None if not rate limited."""
+    if response.status_code not in (403, 429):
+        return None
+
+    # Secondary limits send Retry-After; primary limits only the reset time
+    retry_after = response.headers.get("Retry-After")
+    if retry_after is not None:
+        try:
+            return max(float(retry_after), 0.0)
+        except ValueError:
+            return None
+
+    if response.headers.get("x-ratelimit-remaining") == "0":
+        reset = response.headers.get("x-ratelimit-reset")
+        if reset is not None:
+            try:
+                return max(float(reset) - time.time(), 1.0)
+            except ValueError:
+                return None
+    return None
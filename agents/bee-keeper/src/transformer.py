@@ -1,3 +1,4 @@
+import re
 from pathlib import Path
 from typing import Any
 
@@ -5,11 +6,16 @@ import litellm
 import structlog
 import yaml  # type: ignore
 
-from src.config import KeeperSettings
+from src.config import KeeperSettings, load_manifest, load_persona
 from src.dna import BeeContext, PurityReport
 
 logger = structlog.get_logger(__name__)
 
+# Added diff lines (not the "+++" file header) that mention a watched call
+_SUSPECT_ADDITION_RE = re.compile(
+    r"^\+(?!\+\+)(.*(?:print\(|os\.getenv\().*)$", re.MULTILINE
+)
+
 
 class BeeTransformer:
     """T - Transformer: Analyzes purity and generates reports."""
@@ -19,20 +25,10 @@ class BeeTransformer:
         self.model = settings.llm__model
         litellm.api_key = settings.llm__api_key
 
-        prompt_path = Path("prompts/bee_keeper.md")
-        self.persona = (
-            prompt_path.read_text()
-            if prompt_path.exists()
-            else "You are bee.Keeper, guardian of the Aura Hive."
-        )
-
-        # Load manifest
-        manifest_path = Path("hive-manifest.yaml")
-        if manifest_path.exists():
-            with open(manifest_path) as f:
-                self.manifest = yaml.safe_load(f)
-        else:
-            self.manifest = {}
+        self.persona = load_persona()
+        self.manifest = load_manifest()
+        # Rendered once; the manifest does not change between audits
+        self._manifest_yaml = yaml.dump(self.manifest)
 
     async def think(self, context: BeeContext) -> PurityReport:
         logger.info("bee_transformer_think_started")
@@ -76,18 +72,17 @@ class BeeTransformer:
                     )
 
         # 2. Pattern Enforcement (No raw print or os.getenv in diff)
-        diff_lines = context.git_diff.splitlines()
-        for line in diff_lines:
-            if line.startswith("+") and not line.startswith("+++"):
-                added_code = line[1:].strip()
-                if "print(" in added_code and "logger" not in added_code:
-                    heresies.append(
-                        f"Pattern Heresy: Raw 'print()' detected in diff: `{added_code}`. Use `structlog` instead."
-                    )
-                if "os.getenv(" in added_code and "settings" not in added_code:
-                    heresies.append(
-                        f"Pattern Heresy: Raw 'os.getenv()' detected in diff: `{added_code}`. Use `settings` instead."
-                    )
+        # One regex pass over the whole diff instead of testing every line
+        for match in _SUSPECT_ADDITION_RE.finditer(context.git_diff):
+            added_code = match.group(1).strip()
+            if "print(" in added_code and "logger" not in added_code:
+                heresies.append(
+                    f"Pattern Heresy: Raw 'print()' detected in diff: `{added_code}`. Use `structlog` instead."
+                )
+            if "os.getenv(" in added_code and "settings" not in added_code:
+                heresies.append(
+                    f"Pattern Heresy: Raw 'os.getenv()' detected in diff: `{added_code}`. Use `settings` instead."
+                )
 
         return heresies
 
@@ -96,7 +91,7 @@ class BeeTransformer:
         {self.persona}
 
         ### Sacred Architecture Manifest
-        {yaml.dump(self.manifest)}
+        {self._manifest_yaml}
 
         ### Current Hive Signals
         **Git Diff:**
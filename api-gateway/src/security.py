@@ -4,6 +4,8 @@ Security Module for Aura Platform API Gateway
 Implements cryptographic signature verification for incoming requests.
 """
 
+import base64
+import functools
 import hashlib
 import json
 import time
@@ -15,6 +17,10 @@ from fastapi import Header, HTTPException, Request
 
 # Configuration constants
 TIMESTAMP_TOLERANCE_SECONDS = 60  # Allow ±60 seconds for clock skew
+SIGNATURE_BYTES = 64  # Raw Ed25519 signature size
+BASE64URL_SIGNATURE_LENGTH = 86  # Unpadded base64url
+HEX_SIGNATURE_LENGTH = 128  # Legacy hex encoding
+VERIFY_KEY_CACHE_SIZE = 1024  # Distinct agent DIDs whose keys are kept
 
 
 async def verify_signature(
@@ -36,7 +42,7 @@ async def verify_signature(
         request: FastAPI Request object
         x_agent_id: X-Agent-ID header (DID)
         x_timestamp: X-Timestamp header (Unix timestamp)
-        x_signature: X-Signature header (hex-encoded signature)
+        x_signature: X-Signature header (base64url or hex-encoded signature)
 
     Returns:
         str: Verified agent DID
@@ -59,6 +65,15 @@ async def verify_signature(
             detail=f"Missing required security headers: {', '.join(missing_headers)}",
         )
 
+    # Reject malformed signatures before any key, body or curve work
+    try:
+        signature_bytes = _decode_signature(x_signature)
+    except ValueError:
+        raise HTTPException(
+            status_code=401,
+            detail="Invalid signature format. Expected a base64url or hex-encoded string.",
+        ) from None
+
     # 2. Validate DID format
     if not _validate_did_format(x_agent_id):
         raise HTTPException(
@@ -88,9 +103,7 @@ async def verify_signature(
 
     # 4. Extract public key from DID
     try:
-        public_key_hex = x_agent_id[8:]  # Remove "did:key:" prefix
-        public_key_bytes = bytes.fromhex(public_key_hex)
-        verify_key = nacl.signing.VerifyKey(public_key_bytes)
+        verify_key = _verify_key_for(x_agent_id)
     except ValueError as e:
         raise HTTPException(
             status_code=401, detail=f"Invalid public key in DID: {str(e)}"
@@ -117,7 +130,6 @@ async def verify_signature(
         message = f"{request.method}{request.url.path}{x_timestamp}{body_hash}"
 
         # 6. Verify the signature
-        signature_bytes = bytes.fromhex(x_signature)
         verify_key.verify(message.encode("utf-8"), signature_bytes)
 
     except json.JSONDecodeError:
@@ -130,7 +142,7 @@ async def verify_signature(
     except ValueError:
         raise HTTPException(
             status_code=401,
-            detail="Invalid signature format. Expected a hex-encoded string.",
+            detail="Invalid signature format. Expected a base64url or hex-encoded string.",
         ) from None
     except Exception:
         raise HTTPException(
@@ -142,6 +154,44 @@ async def verify_signature(
     return x_agent_id
 
 
+@functools.lru_cache(maxsize=VERIFY_KEY_CACHE_SIZE)
+def _verify_key_for(did: str) -> nacl.signing.VerifyKey:
+    """
+    Build the verify key for a DID, cached so returning agents skip the decode.
+
+    Invalid keys raise on every call; lru_cache does not cache exceptions.
+
+    Raises:
+        ValueError: If the DID does not carry a valid Ed25519 public key
+    """
+    public_key_hex = did[8:]  # Remove "did:key:" prefix
+    return nacl.signing.VerifyKey(bytes.fromhex(public_key_hex))
+
+
+def _decode_signature(signature: str) -> bytes:
+    """
+    Decode an X-Signature header value.
+
+    Clients send unpadded base64url (86 characters); 128-character values
+    are the legacy hex encoding and are still accepted. Any other length is
+    rejected without decoding.
+
+    Raises:
+        ValueError: If the value is not a 64-byte signature in either encoding
+    """
+    if len(signature) == BASE64URL_SIGNATURE_LENGTH:
+        signature_bytes = base64.urlsafe_b64decode(signature + "==")
+    elif len(signature) == HEX_SIGNATURE_LENGTH:
+        signature_bytes = bytes.fromhex(signature)
+    else:
+        raise ValueError(f"Unexpected signature length: {len(signature)}")
+
+    # Both decoders skip some characters, so the result is checked as well
+    if len(signature_bytes) != SIGNATURE_BYTES:
+        raise ValueError(f"Unexpected signature size: {len(signature_bytes)}")
+    return signature_bytes
+
+
 def _validate_did_format(did: str) -> bool:
     """
     Validate that a DID follows the expected format.
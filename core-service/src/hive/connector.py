@@ -1,7 +1,8 @@
 import asyncio
 import time
 import uuid
-from typing import Any
+from collections.abc import Awaitable, Callable
+from typing import Any, ClassVar
 
 import structlog
 from sqlalchemy.exc import SQLAlchemyError
@@ -34,28 +35,12 @@ class HiveConnector:
         response.session_token = "sess_" + (context.request_id or str(uuid.uuid4()))
         response.valid_until_timestamp = int(time.time() + 600)
 
-        if action.action == "accept":
-            response.accepted.final_price = action.price
-            response.accepted.reservation_code = f"HIVE-{uuid.uuid4()}"
-
-            if self.settings.crypto.enabled and self.market_service:
-                await self._handle_crypto_lock(response, action, context)
-
-        elif action.action == "counter":
-            response.countered.proposed_price = action.price
-            response.countered.human_message = action.message
-            response.countered.reason_code = "NEGOTIATION_ONGOING"
-
-        elif action.action == "reject":
-            response.rejected.reason_code = "OFFER_TOO_LOW"
-
-        elif action.action == "ui_required":
-            # Policy violation or complex deal requiring human intervention
-            response.rejected.reason_code = "UI_REQUIRED"
-
-        else:
+        handler = self._ACTIONS.get(action.action)
+        if handler is None:
             logger.error("unknown_action_type", action=action.action)
             response.rejected.reason_code = "INTERNAL_ERROR"
+        else:
+            await handler(self, response, action, context)
 
         return Observation(
             success=True,
@@ -64,6 +49,53 @@ class HiveConnector:
             metadata={"decision": action},
         )
 
+    async def _apply_accept(
+        self,
+        response: negotiation_pb2.NegotiateResponse,
+        action: IntentAction,
+        context: HiveContext,
+    ) -> None:
+        response.accepted.final_price = action.price
+        response.accepted.reservation_code = f"HIVE-{uuid.uuid4()}"
+
+        if self.settings.crypto.enabled and self.market_service:
+            await self._handle_crypto_lock(response, action, context)
+
+    async def _apply_counter(
+        self,
+        response: negotiation_pb2.NegotiateResponse,
+        action: IntentAction,
+        context: HiveContext,
+    ) -> None:
+        response.countered.proposed_price = action.price
+        response.countered.human_message = action.message
+        response.countered.reason_code = "NEGOTIATION_ONGOING"
+
+    async def _apply_reject(
+        self,
+        response: negotiation_pb2.NegotiateResponse,
+        action: IntentAction,
+        context: HiveContext,
+    ) -> None:
+        response.rejected.reason_code = "OFFER_TOO_LOW"
+
+    async def _apply_ui_required(
+        self,
+        response: negotiation_pb2.NegotiateResponse,
+        action: IntentAction,
+        context: HiveContext,
+    ) -> None:
+        # Policy violation or complex deal requiring human intervention
+        response.rejected.reason_code = "UI_REQUIRED"
+
+    # IntentAction.action -> response builder, looked up once per act()
+    _ACTIONS: ClassVar[dict[str, Callable[..., Awaitable[None]]]] = {
+        "accept": _apply_accept,
+        "counter": _apply_counter,
+        "reject": _apply_reject,
+        "ui_required": _apply_ui_required,
+    }
+
     async def _handle_crypto_lock(
         self,
         response: negotiation_pb2.NegotiateResponse,
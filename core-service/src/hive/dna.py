@@ -1,9 +1,8 @@
-from typing import Any, Protocol, runtime_checkable
+from typing import Any, Protocol
 
 from .types import Event, HiveContext, IntentAction, Observation
 
 
-@runtime_checkable
 class Aggregator(Protocol):
     """A - Aggregator: Consolidates internal state and external metrics."""
 
@@ -12,28 +11,24 @@ class Aggregator(Protocol):
     async def get_system_metrics(self) -> dict[str, Any]: ...
 
 
-@runtime_checkable
 class Transformer(Protocol):
     """T - Transformer: Handles the DSPy reasoning."""
 
     async def think(self, context: HiveContext) -> IntentAction: ...
 
 
-@runtime_checkable
 class Connector(Protocol):
     """C - Connector: Manages gRPC and External API outputs."""
 
     async def act(self, action: IntentAction, context: HiveContext) -> Observation: ...
 
 
-@runtime_checkable
 class Generator(Protocol):
     """G - Generator: Emits NATS heartbeats and events."""
 
     async def pulse(self, observation: Observation) -> list[Event]: ...
 
 
-@runtime_checkable
 class Membrane(Protocol):
     """Inbound/Outbound safety checks (Guardrails)."""
 
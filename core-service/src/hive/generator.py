@@ -1,8 +1,8 @@
-import json
+import asyncio
 import time
 from typing import Any
 
-import nats.errors
+import orjson
 import structlog
 
 from src.config import get_settings
@@ -11,6 +11,20 @@ from .types import Event, Observation
 
 logger = structlog.get_logger(__name__)
 
+# Max events written to the NATS buffer before one flush round-trip
+PUBLISH_BATCH_SIZE = 256
+FLUSH_TIMEOUT = 2.0
+# Events held while NATS is slow; beyond this new events are dropped
+MAX_PENDING_EVENTS = 10_000
+# Longest aclose() waits for queued events before giving up on them
+CLOSE_TIMEOUT = 5.0
+
+# Topics for the event types HiveConnector emits, built once
+_EVENT_TOPICS = {
+    f"negotiation_{action}": f"aura.hive.events.negotiation_{action}"
+    for action in ("accept", "counter", "reject", "ui_required", "error")
+}
+
 
 class HiveGenerator:
     """G - Generator: Emits events (heartbeats, transactions) to NATS."""
@@ -18,13 +32,24 @@ class HiveGenerator:
     def __init__(self, nats_client: Any = None) -> None:
         self.nc = nats_client
         self.settings = get_settings()
+        self._queue: asyncio.Queue[Event] = asyncio.Queue(maxsize=MAX_PENDING_EVENTS)
+        self._flusher_task: asyncio.Task[None] | None = None
 
     async def pulse(self, observation: Observation) -> list[Event]:
         """
         Generate events based on the observation and emit them.
+
+        Events are queued for a background flusher, so the metabolic cycle
+        never waits on NATS. Without a NATS client nothing is emitted and
+        an empty list is returned.
         """
+        if self.nc is None:
+            return []
+
         events = []
-        now = time.time()
+        # One clock read: nanoseconds on the Event, seconds on the wire
+        now_ns = time.time_ns()
+        now = now_ns / 1e9
 
         # 1. Negotiation Event
         if observation.event_type:
@@ -39,9 +64,10 @@ class HiveGenerator:
 
             events.append(
                 Event(
-                    topic=f"aura.hive.events.{observation.event_type}",
+                    topic=_EVENT_TOPICS.get(observation.event_type)
+                    or f"aura.hive.events.{observation.event_type}",
                     payload=payload,
-                    timestamp=now,
+                    timestamp=now_ns,
                 )
             )
 
@@ -54,21 +80,73 @@ class HiveGenerator:
                     "timestamp": now,
                     "service": "core-service",
                 },
-                timestamp=now,
+                timestamp=now_ns,
             )
         )
 
-        # 3. Emit to NATS
+        # 3. Hand off to the NATS flusher
         if self.nc and self.nc.is_connected:
+            self._ensure_flusher()
             for event in events:
                 try:
-                    await self.nc.publish(
-                        event.topic, json.dumps(event.payload).encode()
-                    )
-                except (
-                    nats.errors.ConnectionClosedError,
-                    nats.errors.TimeoutError,
-                ) as e:
-                    logger.error("nats_publish_failed", topic=event.topic, error=str(e))
+                    self._queue.put_nowait(event)
+                except asyncio.QueueFull:
+                    logger.warning("hive_event_dropped", topic=event.topic)
 
         return events
+
+    def _ensure_flusher(self) -> None:
+        if self._flusher_task is None or self._flusher_task.done():
+            self._flusher_task = asyncio.create_task(self._flusher())
+
+    async def _flusher(self) -> None:
+        """Drain queued events into NATS, flushing once per batch."""
+        # Resolved once for the task's lifetime rather than per event
+        queue = self._queue
+        publish = self.nc.publish
+        dumps = orjson.dumps
+
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < PUBLISH_BATCH_SIZE and not queue.empty():
+                batch.append(queue.get_nowait())
+
+            try:
+                for event in batch:
+                    try:
+                        # Only appends to the client's pending buffer
+                        await publish(event.topic, dumps(event.payload))
+                    except Exception as e:
+                        # One bad event (unserialisable payload, failed
+                        # publish) must not stop the flusher
+                        logger.error(
+                            "nats_publish_failed", topic=event.topic, error=str(e)
+                        )
+                try:
+                    await self.nc.flush(timeout=FLUSH_TIMEOUT)
+                except Exception as e:
+                    logger.error(
+                        "nats_flush_failed", batch_size=len(batch), error=str(e)
+                    )
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def aclose(self) -> None:
+        """Publish whatever is still queued (bounded wait) and stop the flusher."""
+        if self._flusher_task is None:
+            return
+        if not self._flusher_task.done():
+            try:
+                await asyncio.wait_for(self._queue.join(), timeout=CLOSE_TIMEOUT)
+            except TimeoutError:
+                logger.warning("hive_events_unflushed", pending=self._queue.qsize())
+        self._flusher_task.cancel()
+        try:
+            await self._flusher_task
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            # Shutdown continues regardless; callers still close NATS after this
+            logger.error("hive_flusher_failed", error=str(e))
+        self._flusher_task = None
@@ -43,15 +43,24 @@ class MetabolicLoop:
             # 2. Aggregator (A) - Perceive/Sense
             with tracer.start_as_current_span("nucleotide_aggregator") as a_span:
                 context = await self.aggregator.perceive(signal)
-                a_span.set_attribute("item_id", context.item_id)
-                a_span.set_attribute("bid_amount", context.offer.bid_amount)
-                span.set_attribute("item_id", context.item_id)
+                if a_span.is_recording():
+                    a_span.set_attributes(
+                        {
+                            "item_id": context.item_id,
+                            "bid_amount": context.offer.bid_amount,
+                        }
+                    )
+                # The outer span may be sampled differently from this one
+                if span.is_recording():
+                    span.set_attribute("item_id", context.item_id)
 
             # 3. Transformer (T) - Think/Reason
             with tracer.start_as_current_span("nucleotide_transformer") as t_span:
                 decision = await self.transformer.think(context)
-                t_span.set_attribute("action", decision.action)
-                t_span.set_attribute("price", decision.price)
+                if t_span.is_recording():
+                    t_span.set_attributes(
+                        {"action": decision.action, "price": decision.price}
+                    )
 
             # 4. Membrane (Outbound) - Guard/Verify
             with tracer.start_as_current_span("nucleotide_membrane_out") as m_out_span:
@@ -64,8 +73,13 @@ class MetabolicLoop:
                     )
                     m_out_span.set_attribute("overridden", True)
 
-                m_out_span.set_attribute("final_action", safe_decision.action)
-                m_out_span.set_attribute("final_price", safe_decision.price)
+                if m_out_span.is_recording():
+                    m_out_span.set_attributes(
+                        {
+                            "final_action": safe_decision.action,
+                            "final_price": safe_decision.price,
+                        }
+                    )
 
             # 5. Connector (C) - Act/Output
             with tracer.start_as_current_span("nucleotide_connector") as c_span:
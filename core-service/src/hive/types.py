@@ -1,8 +1,9 @@
+import time
 from dataclasses import dataclass, field
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NegotiationOffer:
     """Internal representation of an incoming bid."""
 
@@ -11,7 +12,7 @@ class NegotiationOffer:
     agent_did: str
 
 
-@dataclass
+@dataclass(slots=True)
 class HiveContext:
     """Consolidated context for the Hive's decision making."""
 
@@ -23,7 +24,7 @@ class HiveContext:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class IntentAction:
     """Strictly typed intent returned by the Transformer."""
 
@@ -34,7 +35,7 @@ class IntentAction:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class FailureIntent(IntentAction):
     """Specialized intent for when the LLM or processing fails."""
 
@@ -44,7 +45,7 @@ class FailureIntent(IntentAction):
     message: str = "Internal processing error. Defaulting to safe state."
 
 
-@dataclass
+@dataclass(slots=True)
 class Observation:
     """Observation resulting from an action."""
 
@@ -54,10 +55,10 @@ class Observation:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     """An event emitted to the Hive's blood stream (NATS)."""
 
     topic: str
     payload: dict[str, Any]
-    timestamp: float = field(default_factory=lambda: 0.0)
+    timestamp: int = field(default_factory=time.time_ns)  # Unix epoch, ns
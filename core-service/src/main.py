@@ -349,7 +349,13 @@ async def serve() -> None:
 
     # 1. Initialize gRPC Server early
     server = grpc.aio.server(
-        futures.ThreadPoolExecutor(max_workers=settings.server.grpc_max_workers)
+        futures.ThreadPoolExecutor(max_workers=settings.server.grpc_max_workers),
+        # Accept the Telegram adapter's idle keepalive pings (every 30s) rather
+        # than answering them with GOAWAY too_many_pings
+        options=[
+            ("grpc.keepalive_permit_without_calls", 1),
+            ("grpc.http2.min_ping_interval_without_data_ms", 20000),
+        ],
     )
 
     # 2. Register Health Service immediately
@@ -442,6 +448,7 @@ async def serve() -> None:
     try:
         await server.wait_for_termination()
     finally:
+        await generator.aclose()
         if nc:
             await nc.close()
             logger.info("nats_connection_closed")
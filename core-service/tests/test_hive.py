@@ -1,9 +1,11 @@
 from unittest.mock import AsyncMock, MagicMock
 
+import nats.errors
 import pytest
 from src.hive.aggregator import HiveAggregator
+from src.hive.generator import HiveGenerator
 from src.hive.membrane import HiveMembrane
-from src.hive.types import HiveContext, IntentAction, NegotiationOffer
+from src.hive.types import HiveContext, IntentAction, NegotiationOffer, Observation
 
 
 @pytest.mark.asyncio
@@ -107,3 +109,66 @@ async def test_membrane_invalid_min_margin(mocker):
     safe_decision = await membrane.inspect_outbound(decision, context)
     # required = 100 / (1 - 0.1) = 111.11. 200 > 111.11 so it's fine.
     assert safe_decision.price == 200.0
+
+
+@pytest.mark.asyncio
+async def test_generator_publishes_in_background():
+    nc = MagicMock(is_connected=True)
+    nc.publish = AsyncMock()
+    nc.flush = AsyncMock()
+    generator = HiveGenerator(nats_client=nc)
+
+    events = await generator.pulse(
+        Observation(success=True, data=None, event_type="deal_accepted")
+    )
+    await generator.aclose()
+
+    assert [e.topic for e in events] == [
+        "aura.hive.events.deal_accepted",
+        "aura.hive.heartbeat",
+    ]
+    assert [c.args[0] for c in nc.publish.call_args_list] == [e.topic for e in events]
+    assert events[0].timestamp == events[1].timestamp > 0
+    assert events[0].payload["timestamp"] == events[0].timestamp / 1e9
+    nc.flush.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_generator_keeps_flushing_after_nats_errors():
+    nc = MagicMock(is_connected=True)
+    nc.publish = AsyncMock(side_effect=nats.errors.OutboundBufferLimitError)
+    nc.flush = AsyncMock()
+    generator = HiveGenerator(nats_client=nc)
+
+    await generator.pulse(Observation(success=True, data=None, event_type="x"))
+    await generator.aclose()
+
+    # Every event was attempted and the batch still flushed
+    assert nc.publish.await_count == 2
+    nc.flush.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_generator_survives_non_nats_errors():
+    nc = MagicMock(is_connected=True)
+    nc.publish = AsyncMock(side_effect=RuntimeError("boom"))
+    nc.flush = AsyncMock(side_effect=RuntimeError("boom"))
+    generator = HiveGenerator(nats_client=nc)
+
+    await generator.pulse(Observation(success=True, data=None, event_type="x"))
+    await generator.pulse(Observation(success=True, data=None, event_type="x"))
+    # Shutdown must not re-raise, so main() still closes NATS afterwards
+    await generator.aclose()
+
+    assert nc.publish.await_count == 4
+
+
+@pytest.mark.asyncio
+async def test_generator_without_nats_emits_nothing():
+    generator = HiveGenerator(nats_client=None)
+
+    events = await generator.pulse(
+        Observation(success=True, data=None, event_type="negotiation_accept")
+    )
+
+    assert events == []
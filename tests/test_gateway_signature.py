@@ -0,0 +1,55 @@
+"""
+Tests for the API Gateway's X-Signature decoding.
+"""
+
+import base64
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "api-gateway" / "src"))
+
+from security import _decode_signature  # noqa: E402
+
+from agent_identity import AgentWallet  # noqa: E402
+
+RAW_SIGNATURE = bytes(range(64))
+
+
+def test_decodes_unpadded_base64url():
+    encoded = base64.urlsafe_b64encode(RAW_SIGNATURE).rstrip(b"=").decode()
+    assert len(encoded) == 86
+    assert _decode_signature(encoded) == RAW_SIGNATURE
+
+
+def test_decodes_legacy_hex():
+    encoded = RAW_SIGNATURE.hex()
+    assert len(encoded) == 128
+    assert _decode_signature(encoded) == RAW_SIGNATURE
+
+
+def test_decodes_wallet_signature():
+    # The wire format AgentWallet.sign_request produces
+    _, _, signature = AgentWallet().sign_request("POST", "/v1/negotiate", {})
+    assert len(_decode_signature(signature)) == 64
+
+
+@pytest.mark.parametrize("length", [0, 85, 87, 127, 129])
+def test_rejects_other_lengths(length):
+    with pytest.raises(ValueError, match="Unexpected signature length"):
+        _decode_signature("a" * length)
+
+
+def test_rejects_hex_with_bad_characters():
+    with pytest.raises(ValueError):
+        _decode_signature("zz" * 64)
+
+
+def test_rejects_base64url_that_decodes_to_wrong_size():
+    # Characters outside the alphabet are skipped, leaving too few bytes
+    encoded = base64.urlsafe_b64encode(RAW_SIGNATURE).rstrip(b"=").decode()
+    with pytest.raises(ValueError, match="Unexpected signature size"):
+        _decode_signature("!!!!" + encoded[4:])
@@ -4,12 +4,13 @@ Test script for Aura Platform Security Implementation
 Tests the cryptographic signature verification functionality.
 """
 
+import base64
 import hashlib
 import json
 
 import pytest
 
-from agent_identity import AgentWallet
+from agent_identity import AgentWallet, canonical_json
 
 
 def test_agent_wallet():
@@ -110,6 +111,26 @@ def test_signature_verification_flow():
     assert is_valid, "Valid signature should pass verification"
     print("✅ Valid signature verified successfully")
 
+    # Pre-serialized bodies must hash exactly like the Gateway's canonical form
+    assert canonical_json(test_payload) == body_json.encode("utf-8")
+    _, bytes_timestamp, bytes_signature = wallet.sign_request_bytes(
+        method, path, canonical_json(test_payload)
+    )
+    bytes_message = f"{method}{path}{bytes_timestamp}{body_hash}"
+    assert wallet.verify_signature(bytes_message, bytes_signature)
+    print("✅ Pre-serialized body signature verified successfully")
+
+    # Signatures travel as unpadded base64url; legacy hex is still accepted
+    assert len(x_signature) == 86
+    raw_signature = base64.urlsafe_b64decode(x_signature + "==")
+    assert wallet.verify_signature(message, raw_signature.hex())
+    print("✅ Legacy hex signature verified successfully")
+
+    # Signatures of any other length are rejected before decoding
+    assert not wallet.verify_signature(message, x_signature[:-1])
+    assert not wallet.verify_signature(message, raw_signature.hex() + "00")
+    print("✅ Wrong-length signatures correctly rejected")
+
     # Test with incorrect message (tampered)
     tampered_message = f"{method}{path}{str(int(x_timestamp) + 100)}{body_hash}"
     is_tampered_valid = wallet.verify_signature(tampered_message, x_signature)